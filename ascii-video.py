@@ -10,12 +10,19 @@ import time
 import os
 import sys
 import shutil
+import subprocess
 from typing import Tuple, Optional, List
 import threading
+import signal
 import queue
-from collections import deque
 from multiprocessing import Pool, cpu_count
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # ASCII character sets for different styles
 ASCII_CHARS = {
     'standard': ' .:-=+*#%@',
@@ -27,57 +34,275 @@ ASCII_CHARS = {
     'ultra': ' `.-\':_,^=;><+!rc*/z?sLTv)J7(|Fi{C}fI31tlu[neoZ5Yxjya]2ESwqkP6h9d4VpOGbUAKXHm8RD#$Bg0MNWQ%&@'
 }
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _render_ascii(gray, lut, out):
+        """Map gray levels to character codes into out, ending each row with a newline"""
+        height, width = gray.shape
+        for r in range(height):
+            for c in range(width):
+                out[r, c] = lut[gray[r, c]]
+            out[r, width] = 10
+    
+    @njit(cache=True)
+    def _write_u8(out, pos, value):
+        """Write value as decimal digits into out at pos, returning the position after them"""
+        if value >= 100:
+            out[pos] = 48 + value // 100
+            pos += 1
+        if value >= 10:
+            out[pos] = 48 + value // 10 % 10
+            pos += 1
+        out[pos] = 48 + value % 10
+        return pos + 1
+    
+    @njit(cache=True)
+    def _render_color(bgr, gray, glyphs, glyph_lens, out):
+        """
+        Write a 24-bit color escape plus the character for every pixel into out,
+        a (height, width, cell_size) byte view of a fixed-width bytes cell grid
+        """
+        height, width = gray.shape
+        for r in range(height):
+            for c in range(width):
+                cell = out[r, c]
+                # ESC[38;2;
+                cell[0] = 27
+                cell[1] = 91
+                cell[2] = 51
+                cell[3] = 56
+                cell[4] = 59
+                cell[5] = 50
+                cell[6] = 59
+                pos = _write_u8(cell, 7, bgr[r, c, 2])
+                cell[pos] = 59
+                pos = _write_u8(cell, pos + 1, bgr[r, c, 1])
+                cell[pos] = 59
+                pos = _write_u8(cell, pos + 1, bgr[r, c, 0])
+                cell[pos] = 109
+                pos += 1
+                level = gray[r, c]
+                for i in range(glyph_lens[level]):
+                    cell[pos] = glyphs[level, i]
+                    pos += 1
+                # Null padding, which bytes cells ignore
+                for i in range(pos, cell.shape[0]):
+                    cell[i] = 0
+
+class FFmpegReader:
+    """
+    Decode through an ffmpeg subprocess that scales frames to the ASCII grid.
+    Mimics the parts of cv2.VideoCapture the playback pipeline uses.
+    """
+    def __init__(self, video_path: str, width: int, height: int, color: bool):
+        self.video_path = video_path
+        self.color = color
+        self.pix_fmt = 'bgr24' if color else 'gray'
+        self.proc = None
+        self._set_size(width, height)
+        self._start()
+    
+    def _set_size(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.shape = (height, width, 3) if self.color else (height, width)
+        self.frame_size = width * height * (3 if self.color else 1)
+    
+    def _start(self, start_time: float = 0.0):
+        """Launch ffmpeg decoding from start_time (seconds) into the video"""
+        cmd = [
+            'ffmpeg', '-nostdin', '-loglevel', 'error', '-hwaccel', 'auto',
+            '-ss', f'{start_time:.3f}', '-i', self.video_path,
+            '-vf', f'scale={self.width}:{self.height}:flags=bilinear',
+            # Pass decoded frames through as-is (like VideoCapture) - no duplicates
+            # to fill a constant rate, which would shift frames after a seek
+            '-vsync', '0', '-f', 'rawvideo', '-pix_fmt', self.pix_fmt, '-'
+        ]
+        # Keep ffmpeg off the terminal - it would put the tty in raw mode and read keys from it
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, bufsize=self.frame_size * 2)
+    
+    def isOpened(self) -> bool:
+        return self.proc is not None
+    
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        # Read into a writable array, like the frames VideoCapture returns
+        frame = np.empty(self.shape, dtype=np.uint8)
+        if self.proc.stdout.readinto(memoryview(frame).cast('B')) < self.frame_size:
+            return False, None
+        return True, frame
+    
+    def grab(self) -> bool:
+        # ffmpeg has already decoded the frame - just consume it
+        return len(self.proc.stdout.read(self.frame_size)) == self.frame_size
+    
+    def set(self, prop_id: int, value: float) -> bool:
+        # Only rewinding (for loop mode) is supported - restart the decoder
+        if prop_id == cv2.CAP_PROP_POS_FRAMES and value == 0:
+            self.release()
+            self._start()
+            return True
+        return False
+    
+    def rescale(self, width: int, height: int, start_time: float):
+        """Restart decoding at start_time (seconds) with frames scaled to a new size"""
+        self.release()
+        self._set_size(width, height)
+        self._start(start_time)
+    
+    def release(self):
+        if self.proc is not None:
+            # Ask ffmpeg to exit cleanly; closing the pipe unblocks a pending write
+            self.proc.terminate()
+            self.proc.stdout.close()
+            try:
+                self.proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+            self.proc = None
+
+# Converter copy used by pool worker processes (set by _init_worker)
+_worker_converter = None
+
+def _init_worker(converter):
+    """Pool initializer - give each worker process its own converter copy"""
+    global _worker_converter
+    _worker_converter = converter
+    # Ctrl+C is handled by the parent, which shuts the pool down cleanly
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # A forked worker inherits the parent's end of the ffmpeg pipe - holding it open
+    # would leave ffmpeg blocked on a write when the parent restarts it mid-video
+    cap = getattr(converter, 'cap', None)
+    if isinstance(cap, FFmpegReader) and cap.proc is not None:
+        cap.proc.stdout.close()
+
+def _convert_frame(item):
+    """Convert one (index, position, frame) item inside a pool worker"""
+    # Frames arrive already scaled to the grid - after a terminal resize, follow it
+    height, width = item[2].shape[:2]
+    if (width, height) != (_worker_converter.width, _worker_converter.ascii_height):
+        _worker_converter.width, _worker_converter.ascii_height = width, height
+        _worker_converter._allocate_buffers()
+    return _worker_converter.timed_convert(item)
+
 class VideoToASCII:
     def __init__(self, video_path: str, width: int = None, fps: int = 30, 
-                 color: bool = False, style: str = 'ultra', quality: str = 'high'):
+                 color: bool = False, style: str = 'ultra', quality: str = 'high',
+                 palette_256: bool = False):
         """
         Initialize the converter
         """
         self.video_path = video_path
         self.target_fps = fps
         self.color = color
+        # Ultra/high use 24-bit color unless squeezed into the 256-color palette,
+        # which takes about half the escape bytes per cell
+        self.true_color = quality in ['ultra', 'high'] and not palette_256
         self.ascii_chars = ASCII_CHARS.get(style, ASCII_CHARS['ultra'])
         self.cap = None
+        self.pool = None
         self.quality = quality
-        self.frame_buffer = deque(maxlen=10)  # Pre-processed frame buffer
-        self.processing_times = deque(maxlen=30)  # Track processing times
+        self.avg_process_time = None  # Running average of sampled processing times
+        self.time_frames = False  # Sample processing times (only needed for stats)
+        self._bar_full = '█' * 50  # Progress bar pieces
+        self._bar_empty = '░' * 50
+        self._prev_cells = None  # Last drawn cell grid, for diffed updates
+        self._repaint = False  # Set when the terminal is resized - redraw everything
+        self._grid_request = None  # (width, height) the grid should switch to, set on resize
+        self.gray_input = False  # Decoder delivers single-channel frames (ffmpeg, monochrome)
+        self._bgr_small = None  # Reused resize/grayscale destinations (see _allocate_buffers)
+        self._gray_small = None
+        self._gpu_src = None  # GPU-side full and scaled frames (see use_cuda_resize)
+        self._gpu_small = None
         
-        # Pre-calculate ASCII lookup table for faster conversion
-        self.ascii_lookup = self._create_lookup_table()
+        # Pre-calculate ASCII lookup tables for faster conversion
+        self.ascii_lookup, self.ascii_lookup_np, self.ascii_lookup_u8 = self._create_lookup_table()
+        
+        # Colored cells are assembled as UTF-8 bytes, so they go to the terminal
+        # without a per-frame encode and cost a quarter of the memory of str cells
+        self._chars_utf8 = np.char.encode(self.ascii_lookup_np, 'utf-8')
+        # The same characters as a padded byte matrix plus lengths, for the Numba kernel;
+        # its cells fit the longest escape ("\033[38;2;255;255;255m") and character
+        glyph_size = self._chars_utf8.dtype.itemsize
+        self._glyphs = self._chars_utf8.view(np.uint8).reshape(256, glyph_size)
+        self._glyph_lens = np.char.str_len(self._chars_utf8)
+        self._color_cell_size = 19 + glyph_size
+        
+        # Pre-format the 24-bit color escapes: the red+green prefix for every
+        # packed (r << 8 | g) key, and the blue suffix for every channel value
+        esc_r = np.array([b"\033[38;2;%d;" % i for i in range(256)])
+        esc_g = np.array([b"%d;" % i for i in range(256)])
+        self._esc_rg = np.char.add(np.repeat(esc_r, 256), np.tile(esc_g, 256))
+        self._esc_b = np.array([b"%dm" % i for i in range(256)])
+        # Snaps channel values to the 6 levels of the xterm color cube
+        self._cube_lut = ((np.arange(256) * 6 // 256) * 51).astype(np.uint8)
+        
+        # 256 color mode - per-channel contributions to the xterm cube index
+        levels = np.arange(256) // 51
+        self._r_term = levels * 36
+        self._g_term = levels * 6
+        self._b_term = levels
+        self._code_to_str = np.array([b"\033[38;5;%dm" % code for code in range(256)])
         
-        # Auto-adjust width to terminal if not specified
-        if width is None:
-            term_width, _ = self.get_terminal_size()
-            self.width = int(term_width * 0.95)
-        else:
-            self.width = width
-            
         # Adjust settings based on quality
         if quality == 'ultra':
-            self.width = min(self.width, 200)
+            self.max_width = 200
             self.skip_frames = False
         elif quality == 'high':
-            self.width = min(self.width, 150)
+            self.max_width = 150
             self.skip_frames = False
         elif quality == 'medium':
-            self.width = min(self.width, 100)
+            self.max_width = 100
             self.skip_frames = True
         else:  # low
-            self.width = min(self.width, 80)
+            self.max_width = 80
             self.skip_frames = True
+        
+        # Auto-adjust width to terminal if not specified (kept for refitting after a resize)
+        self.requested_width = width
+        self.width = self._target_width()
+    
+    def __getstate__(self):
+        """Pickle only the conversion settings (pool workers), not playback resources"""
+        state = self.__dict__.copy()
+        for key in ('cap', 'pool', '_stop', '_prev_cells', '_gpu_src', '_gpu_small'):
+            state.pop(key, None)
+        return state
     
     def _create_lookup_table(self):
-        """Create a lookup table for faster ASCII conversion"""
-        lookup = []
+        """
+        Create the gray level -> character lookup tables for faster ASCII conversion:
+        - a list of characters
+        - the same as a NumPy array, so a whole frame is mapped in one gather
+        - raw character codes (uint8) for pure-ASCII styles so grayscale frames can
+          stay bytes; None for styles with unicode glyphs (blocks, crazy)
+        """
         chars_len = len(self.ascii_chars)
-        for i in range(256):
-            index = int((i / 255) * (chars_len - 1))
-            lookup.append(self.ascii_chars[index])
-        return lookup
+        # Integer brightness -> character index ramp (exact, unlike i / 255 in floats)
+        indices = (np.arange(256) * (chars_len - 1)) // 255
+        lookup_np = np.array(list(self.ascii_chars))[indices]
+        
+        lookup_u8 = None
+        if self.ascii_chars.isascii():
+            lookup_u8 = np.frombuffer(self.ascii_chars.encode('ascii'), dtype=np.uint8)[indices]
+        
+        return lookup_np.tolist(), lookup_np, lookup_u8
     
     def initialize_video(self) -> bool:
         """Initialize video capture"""
-        self.cap = cv2.VideoCapture(self.video_path)
+        # Prefer FFmpeg with hardware decoding where available (VAAPI, NVDEC, D3D11...);
+        # it silently decodes in software when there is no usable device
+        self.cap = None
+        try:
+            self.cap = cv2.VideoCapture(self.video_path, cv2.CAP_FFMPEG,
+                                        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        except (AttributeError, TypeError, cv2.error):
+            # OpenCV older than 4.5.2 - no acceleration constants or open parameters
+            pass
+        if self.cap is None or not self.cap.isOpened():
+            # Older OpenCV, or built without FFmpeg - let it pick a backend
+            self.cap = cv2.VideoCapture(self.video_path)
         if not self.cap.isOpened():
             print(f"❌ ERROR: Couldn't open '{self.video_path}'. The ritual failed to bind your cursed video.")
             return False
@@ -94,82 +319,427 @@ class VideoToASCII:
         
         return True
     
+    def use_scaled_decoder(self) -> bool:
+        """
+        Switch to an ffmpeg decoder that outputs frames already scaled to the
+        ASCII grid (and already gray in monochrome mode), when ffmpeg is installed
+        """
+        if shutil.which('ffmpeg') is None:
+            return False
+        
+        reader = FFmpegReader(self.video_path, self.width, self.ascii_height, self.color)
+        
+        # Make sure ffmpeg can actually decode this file before swapping it in
+        ret, _ = reader.read()
+        reader.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        if not ret:
+            reader.release()
+            return False
+        
+        self.cap.release()
+        self.cap = reader
+        self.gray_input = not self.color
+        return True
+    
+    def use_cuda_resize(self) -> bool:
+        """
+        Resize full frames on the GPU when OpenCV was built with CUDA and a device
+        is present - only the small ASCII-sized frame is copied back
+        """
+        try:
+            # cv2.cuda.resize comes from the optional cudawarping module
+            if not hasattr(cv2.cuda, 'resize') or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+                return False
+            self._gpu_src = cv2.cuda_GpuMat()
+            self._gpu_small = cv2.cuda_GpuMat()
+        except (AttributeError, cv2.error):
+            # OpenCV without the CUDA module, or no usable driver
+            self._gpu_src = None
+            self._gpu_small = None
+            return False
+        return True
+    
     def get_terminal_size(self) -> Tuple[int, int]:
         """Get terminal dimensions"""
         size = shutil.get_terminal_size()
         return size.columns, size.lines
     
-    def calculate_dimensions(self):
-        """Pre-calculate dimensions for all frames"""
-        height, width = self.video_height, self.video_width
-        aspect_ratio = height / width
+    def _target_width(self) -> int:
+        """Width asked for (or 95% of the terminal), capped by the quality level"""
+        if self.requested_width is None:
+            term_width, _ = self.get_terminal_size()
+            return min(int(term_width * 0.95), self.max_width)
+        return min(self.requested_width, self.max_width)
+    
+    def _fit_grid(self, width: int) -> Tuple[int, int]:
+        """(width, height) of the ASCII grid for the video, shrunk to fit the terminal"""
+        aspect_ratio = self.video_height / self.video_width
         
         # ASCII characters are typically twice as tall as wide
-        self.ascii_height = int(self.width * aspect_ratio * 0.55)
+        height = int(width * aspect_ratio * 0.55)
         
         # Get terminal size and ensure we don't exceed it
         term_width, term_height = self.get_terminal_size()
         max_height = term_height - 4
         
-        if self.ascii_height > max_height:
-            self.ascii_height = max_height
-            self.width = int(self.ascii_height / aspect_ratio / 0.55)
+        if height > max_height:
+            height = max_height
+            width = int(height / aspect_ratio / 0.55)
+        
+        if width > term_width - 2:
+            width = term_width - 2
+            height = int(width * aspect_ratio * 0.55)
         
-        if self.width > term_width - 2:
-            self.width = term_width - 2
-            self.ascii_height = int(self.width * aspect_ratio * 0.55)
+        # A tiny terminal still gets a (clipped) 1x1 grid - resize and ffmpeg's
+        # scale filter can't take 0 (which ffmpeg reads as "keep the source size")
+        return max(1, width), max(1, height)
     
-    def frame_to_ascii_fast(self, frame: np.ndarray) -> str:
-        """Optimized frame to ASCII conversion"""
-        # Convert to grayscale if needed
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = frame
+    def calculate_dimensions(self):
+        """Pre-calculate dimensions for all frames"""
+        self.width, self.ascii_height = self._fit_grid(self.width)
+        self._grid_request = (self.width, self.ascii_height)
+    
+    def _allocate_buffers(self):
+        """Preallocate the per-frame scratch images for the current ASCII grid size"""
+        self._bgr_small = np.empty((self.ascii_height, self.width, 3), dtype=np.uint8)
+        self._gray_small = np.empty((self.ascii_height, self.width), dtype=np.uint8)
+    
+    def resize_frame(self, frame: np.ndarray, reuse_buffer: bool = True) -> np.ndarray:
+        """
+        Resize a frame to the ASCII grid (frames already that size pass through).
+        With reuse_buffer the result lands in a preallocated buffer that the next
+        call overwrites - pass False when the result has to outlive the call.
+        """
+        if frame.shape[:2] == (self.ascii_height, self.width):
+            return frame
+        dst = None
+        if reuse_buffer:
+            dst = self._bgr_small if frame.ndim == 3 else self._gray_small
         
-        # Resize frame - use INTER_LINEAR for better speed/quality balance
-        resized = cv2.resize(gray, (self.width, self.ascii_height), interpolation=cv2.INTER_LINEAR)
+        if self._gpu_src is not None:
+            self._gpu_src.upload(frame)
+            cv2.cuda.resize(self._gpu_src, (self.width, self.ascii_height), dst=self._gpu_small,
+                            interpolation=cv2.INTER_LINEAR)
+            return self._gpu_small.download() if dst is None else self._gpu_small.download(dst)
         
-        # Fast ASCII conversion using lookup table
-        ascii_str = ""
-        for row in resized:
-            row_chars = [self.ascii_lookup[pixel] for pixel in row]
-            ascii_str += ''.join(row_chars) + '\n'
+        # Use INTER_LINEAR for better speed/quality balance
+        return cv2.resize(frame, (self.width, self.ascii_height), dst=dst, interpolation=cv2.INTER_LINEAR)
+    
+    def frame_to_ascii_chars(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Convert a frame to its grid of ASCII characters, each row ending in a
+        newline - raw character codes for ASCII styles, unicode otherwise
+        """
+        # Resize first so the color conversion only touches the small grid
+        resized = self.resize_frame(frame)
         
-        return ascii_str
+        # Convert to grayscale unless the decoder already did (known once, not probed per frame)
+        if self.gray_input:
+            gray = resized
+        else:
+            gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY, dst=self._gray_small)
+        
+        if self.ascii_lookup_u8 is None:
+            # Fast ASCII conversion - index the lookup table with the whole frame
+            chars = self.ascii_lookup_np[gray]
+            newlines = np.full((chars.shape[0], 1), '\n', dtype=chars.dtype)
+            return np.column_stack((chars, newlines))
+        
+        grid = np.empty((gray.shape[0], gray.shape[1] + 1), dtype=np.uint8)
+        if NUMBA_AVAILABLE:
+            # Lookup and newlines in a single compiled pass
+            _render_ascii(gray, self.ascii_lookup_u8, grid)
+        else:
+            # OpenCV's SIMD table lookup beats NumPy fancy indexing on uint8 data
+            grid[:, :-1] = cv2.LUT(gray, self.ascii_lookup_u8)
+            grid[:, -1] = ord('\n')
+        return grid
     
-    def frame_to_colored_ascii_fast(self, frame: np.ndarray) -> str:
-        """Optimized colored ASCII conversion"""
+    def frame_to_colored_cells(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a frame to its grid of cells, each a color escape plus character"""
         # Resize frame (keep color)
-        resized = cv2.resize(frame, (self.width, self.ascii_height), interpolation=cv2.INTER_LINEAR)
+        resized = self.resize_frame(frame)
         
-        # Pre-allocate list for better performance
-        lines = []
+        # Luminance for the whole frame in one pass
+        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY, dst=self._gray_small)
         
-        for row in resized:
-            line = []
-            for pixel in row:
-                b, g, r = pixel
-                gray = int(0.299 * r + 0.587 * g + 0.114 * b)
-                char = self.ascii_lookup[gray]
-                
-                # Use simpler color format for better performance
-                if self.quality in ['ultra', 'high']:
-                    line.append(f"\033[38;2;{r};{g};{b}m{char}")
-                else:
-                    # 256 color mode - faster
-                    color_code = 16 + (r//51)*36 + (g//51)*6 + (b//51)
-                    line.append(f"\033[38;5;{color_code}m{char}")
+        if self.true_color:
+            if self.quality == 'high':
+                # Quantize to the 6x6x6 cube (characters keep full luminance detail) -
+                # far fewer distinct colors means fewer cells change between frames
+                resized = cv2.LUT(resized, self._cube_lut)
+            
+            if NUMBA_AVAILABLE:
+                # Format escapes and characters straight into the cell grid's bytes
+                cells = np.empty(gray.shape, dtype=f'S{self._color_cell_size}')
+                _render_color(resized, gray, self._glyphs, self._glyph_lens,
+                              cells.view(np.uint8).reshape(gray.shape + (self._color_cell_size,)))
+                return cells
             
-            lines.append(''.join(line) + "\033[0m")
+            # 24-bit color - gather the pre-formatted escape pieces for every cell at once
+            chars = self._chars_utf8[gray]
+            rg_key = (resized[..., 2].astype(np.uint16) << 8) | resized[..., 1]
+            cells = np.char.add(self._esc_rg[rg_key], np.char.add(self._esc_b[resized[..., 0]], chars))
+        else:
+            # 256 color mode - faster, only 256 distinct escape prefixes
+            chars = self._chars_utf8[gray]
+            codes = 16 + self._r_term[resized[..., 2]] + self._g_term[resized[..., 1]] + self._b_term[resized[..., 0]]
+            cells = np.char.add(self._code_to_str[codes], chars)
+        
+        return cells
+    
+    def _join_chars(self, grid: np.ndarray) -> bytes:
+        """Join a newline-terminated character grid into encoded frame text"""
+        if grid.dtype == np.uint8:
+            return grid.tobytes()
         
-        return '\n'.join(lines) + '\n'
+        # View the contiguous character grid as one string instead of joining cells
+        return str(grid.reshape(-1).view(f'U{grid.size}')[0]).encode('utf-8')
+    
+    def _join_cells(self, cells: np.ndarray) -> bytes:
+        """Join a colored cell grid into encoded frame text, resetting the color after each row"""
+        return b"\033[0m\n".join([b''.join(row) for row in cells.tolist()]) + b"\033[0m\n"
+    
+    def frame_to_ascii_fast(self, frame: np.ndarray) -> str:
+        """Optimized frame to ASCII conversion"""
+        return self._join_chars(self.frame_to_ascii_chars(frame)).decode('utf-8')
+    
+    def frame_to_colored_ascii_fast(self, frame: np.ndarray) -> str:
+        """Optimized colored ASCII conversion"""
+        return self._join_cells(self.frame_to_colored_cells(frame)).decode('utf-8')
     
     def clear_screen(self):
         """Clear the terminal screen"""
         # Use ANSI escape codes for faster clearing
         print("\033[2J\033[H", end='')
     
+    def convert_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a frame to its cell grid with the configured color mode"""
+        if self.color:
+            return self.frame_to_colored_cells(frame)
+        return self.frame_to_ascii_chars(frame)
+    
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler - refit the grid to the new terminal and redraw in full"""
+        self._grid_request = self._fit_grid(self._target_width())
+        self._repaint = True
+    
+    def _apply_grid_request(self):
+        """Switch to the grid size requested after a terminal resize (converter thread)"""
+        size = self._grid_request
+        if size is not None and size != (self.width, self.ascii_height):
+            self.width, self.ascii_height = size
+            self._allocate_buffers()
+    
+    def render_update(self, cells: np.ndarray) -> bytes:
+        """
+        Encoded terminal output that turns the previously drawn frame into this one.
+        Only changed cells are rewritten (cursor-addressed) unless so much
+        changed that repainting the whole frame is shorter.
+        """
+        prev = self._prev_cells
+        self._prev_cells = cells
+        
+        if self._repaint or (prev is not None and prev.shape != cells.shape):
+            # The terminal reflowed the screen (or the grid changed size after a
+            # resize), so nothing drawn can be trusted
+            self._repaint = False
+            if self.color:
+                return b"\033[2J\033[H" + self._join_cells(cells)
+            return b"\033[2J\033[H" + self._join_chars(cells)
+        
+        if prev is not None and prev.shape == cells.shape:
+            changed = cells != prev
+            
+            # A cell update costs its text plus a ~8 byte cursor move
+            # (unicode cells are 4 bytes per character, byte cells 1)
+            if cells.dtype.kind == 'U':
+                cell_len = cells.dtype.itemsize // 4
+            else:
+                cell_len = cells.dtype.itemsize
+            if np.count_nonzero(changed) * (cell_len + 8) < cells.size * cell_len:
+                rows, cols = np.nonzero(changed)
+                texts = cells[changed]
+                if texts.dtype == np.uint8:
+                    texts = texts.view('S1')
+                elif texts.dtype.kind == 'U':
+                    texts = np.char.encode(texts, 'utf-8')
+                parts = [
+                    b"\033[%d;%dH%s" % (row, col, cell)
+                    for row, col, cell in zip((rows + 1).tolist(), (cols + 1).tolist(), texts.tolist())
+                ]
+                if self.color:
+                    parts.append(b"\033[0m")
+                # Leave the cursor under the frame, where a full repaint ends
+                parts.append(b"\033[%d;1H" % (cells.shape[0] + 1))
+                return b''.join(parts)
+        
+        if self.color:
+            return b"\033[H" + self._join_cells(cells)
+        return b"\033[H" + self._join_chars(cells)
+    
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up once playback is stopped"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def _get(self, q: queue.Queue):
+        """Blocking get that returns None once playback is stopped"""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+    
+    def _target_frame_num(self) -> int:
+        """Index of the frame that should be on screen right now"""
+        return int((time.perf_counter() - self._start_time) * self.video_fps)
+    
+    def _reader(self, frame_q: queue.Queue, loop: bool):
+        """Pipeline stage 1: decode frames as (index, position, frame)"""
+        index = 0
+        position = 0
+        try:
+            while not self._stop.is_set():
+                # After a terminal resize, have ffmpeg scale to the new grid from here on
+                size = self._grid_request
+                if isinstance(self.cap, FFmpegReader) and size != (self.cap.width, self.cap.height):
+                    # (seek half a frame early so timestamp rounding can't skip this one)
+                    self.cap.rescale(size[0], size[1], max(0.0, (position - 0.5) / self.video_fps))
+                
+                # Frames that are already late are only grabbed - decoding them
+                # into an image (retrieve) is skipped since they'd be dropped anyway
+                late = index < self._target_frame_num()
+                if late:
+                    ret = self.cap.grab()
+                else:
+                    ret, frame = self.cap.read()
+                
+                if not ret:
+                    # End of video reached - rewind when looping (and the video isn't empty)
+                    if loop and position > 0:
+                        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                        position = 0
+                        continue
+                    break
+                
+                if not late and not self._put(frame_q, (index, position, frame)):
+                    return
+                index += 1
+                position += 1
+        except Exception as e:
+            self._put(frame_q, e)
+            return
+        self._put(frame_q, None)
+    
+    def timed_convert(self, item: tuple) -> tuple:
+        """
+        Convert an (index, position, frame) item, reporting how long it took
+        for every 8th frame when timing is on (None otherwise)
+        """
+        index, position, frame = item
+        if not (self.time_frames and index & 7 == 0):
+            return index, position, self.convert_frame(frame), None
+        process_start = time.perf_counter()
+        cells = self.convert_frame(frame)
+        return index, position, cells, time.perf_counter() - process_start
+    
+    def _on_time_frames(self, frame_q: queue.Queue, slots: Optional[threading.Semaphore] = None):
+        """Yield decoded frames that are still due, skipping ones that are already late"""
+        while True:
+            item = self._get(frame_q)
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                self._reader_error = item
+                return
+            
+            # Skip frames whose presentation time has passed while they were queued
+            if item[0] < self._target_frame_num():
+                continue
+            
+            self._apply_grid_request()
+            
+            # Bound how many frames are in flight in the pool
+            if slots is not None:
+                while not slots.acquire(timeout=0.1):
+                    if self._stop.is_set():
+                        return
+            yield item
+    
+    def _convert_in_pool(self, frame_q: queue.Queue):
+        """Convert frames on the worker pool, keeping their order"""
+        slots = threading.Semaphore(self.pool_size * 2)
+        # Shrink before handing frames over so only the small grid is pickled
+        frames = ((index, position, self.resize_frame(frame, reuse_buffer=False))
+                  for index, position, frame in self._on_time_frames(frame_q, slots))
+        for result in self.pool.imap(_convert_frame, frames, chunksize=2):
+            slots.release()
+            yield result
+    
+    def _converter(self, frame_q: queue.Queue, out_q: queue.Queue):
+        """Pipeline stage 2: convert decoded frames to terminal updates, dropping late ones"""
+        self._reader_error = None
+        try:
+            if self.pool is not None:
+                results = self._convert_in_pool(frame_q)
+            else:
+                results = map(self.timed_convert, self._on_time_frames(frame_q))
+            
+            # Frames arrive in order, so each update can be diffed against the previous one
+            for index, position, cells, process_time in results:
+                if process_time is None:
+                    update = self.render_update(cells)
+                else:
+                    process_start = time.perf_counter()
+                    update = self.render_update(cells)
+                    self._record_process_time(process_time + time.perf_counter() - process_start)
+                # The frame's row count travels along - the grid may change size on a resize
+                if not self._put(out_q, (index, position, update, cells.shape[0])):
+                    return
+            item = self._reader_error
+        except Exception as e:
+            item = e
+        self._put(out_q, item)
+    
+    def _record_process_time(self, process_time: float):
+        """Fold a sampled processing time into the running average"""
+        if self.avg_process_time is None:
+            self.avg_process_time = process_time
+        else:
+            self.avg_process_time = 0.95 * self.avg_process_time + 0.05 * process_time
+    
+    def _render_info(self, index: int, position: int, dropped_frames: int, elapsed: float,
+                     rows: int) -> bytes:
+        """Encoded live-stats line, drawn under the rows-tall frame without moving the cursor"""
+        # Calculate actual FPS and progress
+        actual_fps = index / elapsed if elapsed > 0 else 0
+        progress = min((position / self.total_frames) * 100, 100.0)
+        
+        # Progress bar - slicing the precomputed halves also clamps an overshoot
+        # (the container's frame count can be lower than the frames decoded)
+        filled_length = len(self._bar_full) * position // self.total_frames
+        bar = self._bar_full[:filled_length] + self._bar_empty[filled_length:]
+        
+        info = [
+            f"[{bar}] {progress:.1f}%",
+            f"Frame {position}/{self.total_frames}",
+            f"FPS: {actual_fps:.1f}/{self.video_fps:.1f}",
+            f"Time: {position * self.frame_delay:.1f}s/{self.video_duration:.1f}s",
+        ]
+        if dropped_frames > 0:
+            info.append(f"Dropped: {dropped_frames}")
+        
+        # Save cursor, jump to the line under the frame, erase whatever a longer
+        # previous line left behind, then restore the cursor for the next frame
+        return (f"\0337\033[{rows + 1};1H" + ' | '.join(info) + "\033[K\0338").encode('utf-8')
+    
     def play_ascii_video(self, loop: bool = False, show_info: bool = True):
         """Play the video with proper frame timing"""
         if not self.initialize_video():
@@ -178,6 +748,14 @@ class VideoToASCII:
         # Pre-calculate dimensions
         self.calculate_dimensions()
         
+        self._allocate_buffers()
+        
+        # Let ffmpeg scale while decoding instead of resizing full frames
+        scaled_decode = self.use_scaled_decoder()
+        
+        # Otherwise the full frames get resized, on the GPU if there is one
+        gpu_resize = not scaled_decode and self.use_cuda_resize()
+        
         # Start info
         self.clear_screen()
         print(f"\n{'='*60}")
@@ -189,112 +767,100 @@ class VideoToASCII:
         print(f"⚡ Native FPS: {self.video_fps:.1f}")
         print(f"⏱️ Duration of Suffering: {self.video_duration:.1f}s")
         print(f"🌈 Rainbow Vomit: {'ON' if self.color else 'OFF'}")
+        if self.color:
+            print(f"🖍️ Palette: {'24-bit' if self.true_color else '256 colors'}")
+        print(f"🎞️ Decoder: {'ffmpeg (scaled)' if scaled_decode else 'OpenCV + CUDA resize' if gpu_resize else 'OpenCV'}")
         print(f"{'='*60}")
         print(f"\n⌨️  Mash Ctrl+C to escape the madness\n")
-        time.sleep(2)
         
-        frame_count = 0
-        start_time = time.perf_counter()
+        # Warm up the converter (compiles the Numba kernel) while the banner is up
+        banner_start = time.perf_counter()
+        channels = () if self.gray_input else (3,)
+        self.convert_frame(np.zeros((self.ascii_height, self.width) + channels, dtype=np.uint8))
+        time.sleep(max(0, 2 - (time.perf_counter() - banner_start)))
+        
+        # Fresh diff state; processing times are only sampled when stats are shown
+        self._prev_cells = None
+        self._repaint = False
+        self.time_frames = show_info
+        
+        # 24-bit colored conversion is the heaviest - spread it over worker processes
+        self.pool_size = max(1, cpu_count() - 1)
+        if self.color and self.true_color and self.pool_size > 1:
+            self.pool = Pool(self.pool_size, initializer=_init_worker, initargs=(self,))
+        
+        # Decode -> convert -> display pipeline; bounded queues give backpressure
+        frame_q = queue.Queue(maxsize=4)
+        out_q = queue.Queue(maxsize=4)
+        self._stop = threading.Event()
+        self._start_time = start_time = time.perf_counter()
+        workers = [
+            threading.Thread(target=self._reader, args=(frame_q, loop), daemon=True),
+            threading.Thread(target=self._converter, args=(frame_q, out_q), daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        
+        frames_displayed = 0
         dropped_frames = 0
-        last_displayed_frame = None
+        last_index = -1
+        
+        # Clear once - after this, frames only overwrite what changed.
+        # The cursor is hidden so it doesn't flicker across updated cells.
+        self.clear_screen()
+        print("\033[?25l", end='')
+        sys.stdout.flush()
+        
+        # Frames are already encoded, so skip the text layer and write raw bytes -
+        # each frame and its stats line are gathered in one reused buffer so the
+        # terminal gets a single write per frame
+        out = sys.stdout.buffer
+        frame_buf = bytearray()
+        last_info_time = 0.0
+        
+        # Redraw from scratch after a terminal resize (POSIX only)
+        previous_winch = None
+        if hasattr(signal, 'SIGWINCH'):
+            previous_winch = signal.signal(signal.SIGWINCH, self._on_resize)
         
         try:
             while True:
-                current_time = time.perf_counter()
-                elapsed = current_time - start_time
-                
-                # Check if we've exceeded video duration (with small buffer for precision)
-                if elapsed >= self.video_duration + 0.1 and not loop:
+                item = out_q.get()
+                if item is None:
+                    if show_info and last_index >= 0:
+                        # Final stats for the last frame, which the throttle may have skipped
+                        out.write(self._render_info(last_index, position, dropped_frames,
+                                                    time.perf_counter() - start_time, rows))
+                        out.flush()
                     print("\n\n✅ Video playback completed!")
                     break
+                if isinstance(item, Exception):
+                    raise item
                 
-                # Calculate which frame we should be showing based on elapsed time
-                target_frame_num = int(elapsed * self.video_fps)
+                index, position, update, rows = item
                 
-                # If looping and we've exceeded total frames, restart
-                if loop and target_frame_num >= self.total_frames:
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    frame_count = 0
-                    start_time = time.perf_counter()
-                    dropped_frames = 0
-                    continue
+                # Anything the converter skipped between two displayed frames was dropped
+                dropped_frames += index - last_index - 1
+                last_index = index
                 
-                # Ensure we don't try to read beyond the video
-                if target_frame_num >= self.total_frames:
-                    if not loop:
-                        print("\n\n✅ Video playback completed!")
-                        break
-                
-                # Read and process frames until we reach the target frame
-                while frame_count <= target_frame_num and frame_count < self.total_frames:
-                    ret, frame = self.cap.read()
-                    
-                    if not ret:
-                        # End of video reached
-                        if loop:
-                            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                            frame_count = 0
-                            start_time = time.perf_counter()
-                            dropped_frames = 0
-                            break
-                        else:
-                            print("\n\n✅ Video playback completed!")
-                            return  # Exit the function completely
-                    
-                    # Process and display the frame if it's the target
-                    if frame_count == target_frame_num:
-                        # Time the processing
-                        process_start = time.perf_counter()
-                        
-                        # Convert frame to ASCII
-                        if self.color:
-                            ascii_art = self.frame_to_colored_ascii_fast(frame)
-                        else:
-                            ascii_art = self.frame_to_ascii_fast(frame)
-                        
-                        # Clear and display
-                        self.clear_screen()
-                        print(ascii_art, end='')
-                        last_displayed_frame = frame_count
-                        
-                        if show_info:
-                            # Calculate actual FPS and progress
-                            actual_fps = frame_count / elapsed if elapsed > 0 else 0
-                            progress = min((frame_count / self.total_frames) * 100, 100.0)
-                            
-                            # Progress bar
-                            bar_length = 50
-                            filled_length = min(int(bar_length * frame_count // self.total_frames), bar_length)
-                            bar = '█' * filled_length + '░' * (bar_length - filled_length)
-                            
-                            info = f"[{bar}] {progress:.1f}% | "
-                            info += f"Frame {frame_count}/{self.total_frames} | "
-                            info += f"FPS: {actual_fps:.1f}/{self.video_fps:.1f} | "
-                            info += f"Time: {elapsed:.1f}s/{self.video_duration:.1f}s"
-                            if dropped_frames > 0:
-                                info += f" | Dropped: {dropped_frames}"
-                            
-                            print(info, end='', flush=True)
-                        
-                        process_time = time.perf_counter() - process_start
-                        self.processing_times.append(process_time)
-                    else:
-                        # Frame was skipped
-                        dropped_frames += 1
-                    
-                    frame_count += 1
+                # Wait until this frame is due so playback keeps the native speed
+                sleep_duration = start_time + index * self.frame_delay - time.perf_counter()
+                if sleep_duration > 0 and sleep_duration < 1:  # Sanity check on sleep duration
+                    time.sleep(sleep_duration)
                 
-                # Check if we've processed all frames
-                if frame_count >= self.total_frames and not loop:
-                    print("\n\n✅ Video playback completed!")
-                    break
+                # Draw the changes since the previous frame
+                frame_buf[:] = update
+                frames_displayed += 1
                 
-                # Calculate how long to sleep to maintain proper timing
-                next_frame_time = (frame_count / self.video_fps)
-                sleep_duration = next_frame_time - (time.perf_counter() - start_time)
+                # The stats only change visibly a few times a second - refresh them at ~5 Hz
+                current_time = time.perf_counter()
+                if show_info and current_time - last_info_time >= 0.2:
+                    frame_buf += self._render_info(index, position, dropped_frames,
+                                                   current_time - start_time, rows)
+                    last_info_time = current_time
                 
-                if sleep_duration > 0 and sleep_duration < 1:  # Sanity check on sleep duration
-                    time.sleep(sleep_duration)
+                out.write(frame_buf)
+                out.flush()
                 
         except KeyboardInterrupt:
             print("\n\n✋ You pulled the plug on the chaos.")
@@ -303,8 +869,22 @@ class VideoToASCII:
             import traceback
             traceback.print_exc()
         finally:
+            # Stop the pipeline before releasing the capture the reader is using
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+            if self.pool is not None:
+                self.pool.close()
+                self.pool.join()
+                self.pool = None
             self.cap.release()
             
+            if previous_winch is not None:
+                signal.signal(signal.SIGWINCH, previous_winch)
+            
+            # Bring the cursor back
+            print("\033[?25h", end='')
+            
             # Final stats
             total_time = time.perf_counter() - start_time
             if total_time > 0:
@@ -313,11 +893,10 @@ class VideoToASCII:
                 print(f"  • Total playback time: {total_time:.2f}s")
                 print(f"  • Original video duration: {self.video_duration:.2f}s")
                 print(f"  • Time difference: {abs(total_time - self.video_duration):.2f}s")
-                print(f"  • Frames displayed: {last_displayed_frame + 1 if last_displayed_frame is not None else frame_count}")
+                print(f"  • Frames displayed: {frames_displayed}")
                 print(f"  • Frames dropped: {dropped_frames}")
-                if self.processing_times:
-                    avg_process = sum(self.processing_times) / len(self.processing_times)
-                    print(f"  • Avg processing time: {avg_process*1000:.2f}ms")
+                if self.avg_process_time is not None:
+                    print(f"  • Avg processing time: {self.avg_process_time*1000:.2f}ms")
                 print(f"{'='*60}")
 
 def print_banner():
@@ -511,6 +1090,9 @@ def main():
         print("="*50)
         loop = input("🔄 Enable infinite loop mode? [y/N]: ").strip().lower() == 'y'
         show_info = input("📊 Display live suffering stats? [Y/n]: ").strip().lower() != 'n'
+        palette_256 = False
+        if settings['color'] and settings['quality'] in ['ultra', 'high']:
+            palette_256 = input("🖍️ Squeeze colors into the 256-color palette (less terminal traffic)? [y/N]: ").strip().lower() == 'y'
         
         # Create converter with settings
         converter = VideoToASCII(
@@ -519,7 +1101,8 @@ def main():
             fps=30,  # This is now just for display, actual sync uses video FPS
             color=settings['color'],
             style=settings['style'],
-            quality=settings['quality']
+            quality=settings['quality'],
+            palette_256=palette_256
         )
         
         # Final confirmation